@@ -163,15 +163,23 @@ class AlertsMixin:
             self.return_connection(conn)
 
     def get_all_active_alerts(self) -> List[Dict[str, Any]]:
-        """Get all active alerts for processing by the worker."""
+        """
+        Get all active alerts for processing by the worker.
+
+        Each alert includes metrics_changed_at from the stock_metrics change feed
+        so the worker can skip alerts whose symbol has not changed since last_checked.
+        """
         conn = self.get_connection()
         try:
             cursor = conn.cursor()
             cursor.execute("""
-                SELECT id, user_id, symbol, condition_type, condition_params, frequency, status, last_checked, condition_description,
-                       action_type, action_payload, portfolio_id, action_note
-                FROM alerts
-                WHERE status = 'active'
+                SELECT a.id, a.user_id, a.symbol, a.condition_type, a.condition_params, a.frequency, a.status,
+                       a.last_checked, a.condition_description,
+                       a.action_type, a.action_payload, a.portfolio_id, a.action_note,
+                       smc.changed_at AS metrics_changed_at
+                FROM alerts a
+                LEFT JOIN stock_metric_changes smc ON smc.symbol = a.symbol
+                WHERE a.status = 'active'
             """)
             columns = [desc[0] for desc in cursor.description]
             results = []
@@ -1984,4 +1984,22 @@ class SchemaMixin:
             ON strategy_briefings(portfolio_id, generated_at DESC)
         """)
 
+        # Change feed for stock_metrics (one row per symbol, latest change wins)
+        # Written by save_stock_metrics so check_alerts can skip unchanged symbols
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS stock_metric_changes (
+                symbol TEXT PRIMARY KEY,
+                changed_at TIMESTAMP NOT NULL,
+                prev_price REAL,
+                price REAL,
+                price_change_pct REAL,
+                changed_fields TEXT[]
+            )
+        """)
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_stock_metric_changes_changed_at
+            ON stock_metric_changes(changed_at)
+        """)
+
         conn.commit()
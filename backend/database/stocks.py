@@ -2,6 +2,7 @@
 # ABOUTME: Handles CRUD for stock records, insider trades, and cache management
 
 import logging
+import math
 from datetime import datetime, timezone
 from typing import Optional, Dict, Any, List
 import json
@@ -107,8 +108,58 @@ class StocksMixin:
 
         args = [symbol] + list(update_data.values())
 
+        # Record the change feed entry first so it compares against the pre-update row
+        self._record_metric_change(symbol, update_data)
         self.write_queue.put((sql, tuple(args)))
 
+    def _record_metric_change(self, symbol: str, update_data: Dict[str, Any]):
+        """
+        Queue a change-feed upsert for stock_metric_changes.
+
+        Compares the incoming values against the currently stored row and only
+        writes when at least one tracked column differs. Must be queued before
+        the stock_metrics upsert since the writer executes statements in order.
+        """
+        tracked = [col for col in update_data if col not in ('last_updated', 'last_price_updated')]
+        if not tracked:
+            return
+
+        # json_populate_record casts the new values to the stock_metrics column types,
+        # so REAL columns compare against REAL values (not float8 parameters)
+        new_values = {'symbol': symbol}
+        for col in tracked:
+            value = update_data[col]
+            if isinstance(value, float) and not math.isfinite(value):
+                # JSON has no NaN/Infinity literals; Postgres parses these spellings
+                value = 'NaN' if math.isnan(value) else ('Infinity' if value > 0 else '-Infinity')
+            new_values[col] = value
+
+        diff_cases = ', '.join(
+            f"CASE WHEN sm.{col} IS DISTINCT FROM n.{col} THEN '{col}' END" for col in tracked
+        )
+
+        sql = f"""
+            INSERT INTO stock_metric_changes (symbol, changed_at, prev_price, price, price_change_pct, changed_fields)
+            SELECT n.symbol, clock_timestamp(), sm.price, COALESCE(n.price, sm.price),
+                   CASE WHEN sm.price > 0 AND n.price IS NOT NULL
+                        THEN ((n.price - sm.price) / sm.price) * 100 END,
+                   c.fields
+            FROM json_populate_record(NULL::stock_metrics, %s::json) n
+            LEFT JOIN stock_metrics sm ON sm.symbol = n.symbol
+            CROSS JOIN LATERAL (
+                SELECT ARRAY_REMOVE(ARRAY[{diff_cases}], NULL) AS fields
+            ) c
+            WHERE cardinality(c.fields) > 0
+            ON CONFLICT (symbol) DO UPDATE SET
+                changed_at = EXCLUDED.changed_at,
+                prev_price = EXCLUDED.prev_price,
+                price = EXCLUDED.price,
+                price_change_pct = EXCLUDED.price_change_pct,
+                changed_fields = EXCLUDED.changed_fields
+        """
+
+        self.write_queue.put((sql, (json.dumps(new_values, default=str),)))
+
     def save_insider_trades(self, symbol: str, trades: List[Dict[str, Any]]):
         """
         Batch save insider trades with Form 4 enrichment data.
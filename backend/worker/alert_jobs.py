@@ -4,13 +4,26 @@
 import json
 import logging
 import os
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 from typing import Dict, Any
 
 import portfolio_service  # Import portfolio service for automated trading
 
 logger = logging.getLogger(__name__)
 
+# Maximum time an alert can go without re-evaluation even if its symbol's metrics
+# are unchanged. Covers conditions driven by time or by non-metric context
+# (filings, insider trades, earnings dates).
+ALERT_RECHECK_INTERVALS = {
+    'hourly': timedelta(hours=1),
+    'daily': timedelta(days=1),
+    'weekly': timedelta(weeks=1),
+}
+
+# Change-feed rows are stamped before the writer commits, so allow a small
+# overlap to avoid missing changes that landed while an alert was being checked
+CHANGE_FEED_GRACE = timedelta(seconds=60)
+
 
 class AlertJobsMixin:
     """Mixin for check_alerts job and alert evaluation helpers"""
@@ -21,12 +34,18 @@ class AlertJobsMixin:
 
         try:
             active_alerts = self.db.get_all_active_alerts()
+            force = params.get('force', False)
             logger.info(f"Checking {len(active_alerts)} active alerts")
 
             triggered_count = 0
+            skipped_unchanged = 0
 
             for alert in active_alerts:
                 try:
+                    if not force and not self._alert_needs_evaluation(alert):
+                        skipped_unchanged += 1
+                        continue
+
                     is_triggered = False
                     trigger_message = ""
 
@@ -142,12 +161,38 @@ class AlertJobsMixin:
                     logger.error(f"Error checking alert {alert['id']}: {e}")
                     continue
 
-            self.db.complete_job(job_id, result={'triggered_count': triggered_count})
+            if skipped_unchanged:
+                logger.info(f"Skipped {skipped_unchanged} alerts with no metric changes since last check")
+
+            self.db.complete_job(job_id, result={
+                'triggered_count': triggered_count,
+                'skipped_unchanged': skipped_unchanged
+            })
 
         except Exception as e:
             logger.error(f"Check alerts job failed: {e}")
             self.db.fail_job(job_id, str(e))
 
+    def _alert_needs_evaluation(self, alert: Dict[str, Any], now: datetime = None) -> bool:
+        """
+        Decide whether an alert must be re-evaluated on this run.
+
+        An alert is due if it has never been checked, its symbol's metrics changed
+        since it was last checked (per the stock_metric_changes feed), or its
+        frequency interval has elapsed.
+        """
+        last_checked = alert.get('last_checked')
+        if not last_checked:
+            return True
+
+        changed_at = alert.get('metrics_changed_at')
+        if changed_at and changed_at > last_checked - CHANGE_FEED_GRACE:
+            return True
+
+        now = now or datetime.now()
+        interval = ALERT_RECHECK_INTERVALS.get(alert.get('frequency'), ALERT_RECHECK_INTERVALS['daily'])
+        return now - last_checked >= interval
+
     def _evaluate_alert_with_llm(self, symbol: str, condition_description: str,
                                   metrics: Dict[str, Any]) -> tuple[bool, str]:
         """
@@ -152,5 +152,33 @@ class TestTradingAlerts(unittest.TestCase):
         self.worker.llm_client.models.generate_content.assert_not_called()
         self.mock_portfolio_service.execute_trade.assert_not_called()
 
+    def test_skips_alert_when_metrics_unchanged(self):
+        """Test that alerts are not re-evaluated when the change feed shows no new changes."""
+        from datetime import datetime, timedelta
+
+        now = datetime.now()
+        unchanged = {
+            'id': 666, 'symbol': 'TEST', 'condition_type': 'price',
+            'condition_params': {'threshold': 10, 'operator': 'above'},
+            'status': 'active', 'frequency': 'daily',
+            'last_checked': now - timedelta(minutes=10),
+            'metrics_changed_at': now - timedelta(hours=2),
+        }
+        changed = dict(unchanged, id=555, metrics_changed_at=now - timedelta(minutes=1))
+        stale = dict(unchanged, id=444, last_checked=now - timedelta(days=2),
+                     metrics_changed_at=None)
+
+        self.assertFalse(self.worker._alert_needs_evaluation(unchanged, now=now))
+        self.assertTrue(self.worker._alert_needs_evaluation(changed, now=now))
+        self.assertTrue(self.worker._alert_needs_evaluation(stale, now=now))
+
+        self.worker.db.get_all_active_alerts.return_value = [unchanged]
+        self.worker.db.get_stock_metrics.reset_mock()
+        self.worker._run_check_alerts(job_id=4, params={})
+        self.worker.db.get_stock_metrics.assert_not_called()
+
+        self.worker._run_check_alerts(job_id=5, params={'force': True})
+        self.worker.db.get_stock_metrics.assert_called_once_with('TEST')
+
 if __name__ == '__main__':
     unittest.main()